@@ -1,23 +1,30 @@
 from abc import ABC
+from urllib.parse import quote
 import httpx
-import structlog
 
-logger = structlog.get_logger()
+from app.observability import get_logger
+
+logger = get_logger(__name__)
 
 
 class BaseClient(ABC):
-    def __init__(self, http_client: httpx.AsyncClient, base_url: str):
+    def __init__(self, http_client: httpx.AsyncClient):
+        # The HTTP client is expected to be bound to the service's base_url
         self.http_client = http_client
-        self.base_url = base_url.rstrip("/")
 
     async def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = await self.http_client.request(method, url, **kwargs)
+            response = await self.http_client.request(method, endpoint, **kwargs)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
-            logger.error("HTTP request failed", url=url, method=method, error=str(e))
+            logger.error(
+                "HTTP request failed",
+                base_url=str(self.http_client.base_url),
+                endpoint=endpoint,
+                method=method,
+                error=str(e),
+            )
             raise
 
 
@@ -30,10 +37,15 @@ class ExternalServiceAClient(BaseClient):
 
 
 class ExternalServiceBClient(BaseClient):
+    @staticmethod
+    def _item_path(item_id: str) -> str:
+        # Escape the id so it always stays a single path segment
+        return "/api/items/" + quote(item_id, safe="")
+
     async def fetch_metadata(self, item_id: str) -> dict:
-        return await self._make_request("GET", f"/api/items/{item_id}/metadata")
+        return await self._make_request("GET", self._item_path(item_id) + "/metadata")
 
     async def update_status(self, item_id: str, status: str) -> dict:
         return await self._make_request(
-            "PATCH", f"/api/items/{item_id}", json={"status": status}
+            "PATCH", self._item_path(item_id), json={"status": status}
         )
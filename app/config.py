@@ -1,4 +1,6 @@
-from pydantic import Field
+from functools import lru_cache
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -29,6 +31,13 @@ class Settings(BaseSettings):
         default=30.0, description="HTTP request timeout in seconds"
     )
     http_retries: int = Field(default=3, description="Number of HTTP request retries")
+    http_max_connections: int = Field(
+        default=200, description="Maximum number of concurrent HTTP connections"
+    )
+    http_max_keepalive: int = Field(
+        default=50, description="Maximum number of idle keep-alive HTTP connections"
+    )
+    http_http2: bool = Field(default=True, description="Enable HTTP/2 support")
 
     # Logging settings
     log_level: str = Field(default="INFO", description="Logging level")
@@ -67,5 +76,17 @@ class Settings(BaseSettings):
         default=True, description="Enable OpenTelemetry logging"
     )
 
+    @field_validator("external_service_a_url", "external_service_b_url")
+    @classmethod
+    def strip_trailing_slash(cls, value: str) -> str:
+        """Normalize service base URLs once instead of in every client."""
+        return value.rstrip("/")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide validated settings instance."""
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
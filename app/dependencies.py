@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from dependency_injector import containers, providers
 import httpx
 
@@ -6,32 +8,54 @@ from app.clients.external_client import ExternalServiceAClient, ExternalServiceB
 from app.services.business_service import BusinessService
 
 
+# Shared options for the per-service HTTP clients
+_http_client_options = {
+    "timeout": httpx.Timeout(
+        connect=5.0,
+        read=settings.http_timeout,
+        write=settings.http_timeout,
+        pool=5.0,
+    ),
+    "limits": httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive,
+        keepalive_expiry=30.0,
+    ),
+    "http2": settings.http_http2,
+    "follow_redirects": True,
+}
+
+
 class Container(containers.DeclarativeContainer):
     # Configuration
     config = providers.Object(settings)
 
-    # HTTP client
-    http_client = providers.Singleton(
+    # HTTP clients, one per external service so each origin gets its own pool
+    service_a_http_client = providers.Singleton(
+        httpx.AsyncClient,
+        base_url=settings.external_service_a_url,
+        **_http_client_options,
+    )
+
+    service_b_http_client = providers.Singleton(
         httpx.AsyncClient,
-        timeout=settings.http_timeout,
-        follow_redirects=True,
+        base_url=settings.external_service_b_url,
+        **_http_client_options,
     )
 
-    # External service clients
-    external_service_a_client = providers.Factory(
+    # External service clients (stateless, so one instance per process)
+    external_service_a_client = providers.Singleton(
         ExternalServiceAClient,
-        http_client=http_client,
-        base_url=settings.external_service_a_url,
+        http_client=service_a_http_client,
     )
 
-    external_service_b_client = providers.Factory(
+    external_service_b_client = providers.Singleton(
         ExternalServiceBClient,
-        http_client=http_client,
-        base_url=settings.external_service_b_url,
+        http_client=service_b_http_client,
     )
 
     # Business services
-    business_service = providers.Factory(
+    business_service = providers.Singleton(
         BusinessService,
         service_a_client=external_service_a_client,
         service_b_client=external_service_b_client,
@@ -42,14 +66,17 @@ class Container(containers.DeclarativeContainer):
 container = Container()
 
 
-# Dependency functions for FastAPI
+# Dependency functions for FastAPI (cached, the providers are singletons)
+@lru_cache
 def get_business_service() -> BusinessService:
     return container.business_service()
 
 
+@lru_cache
 def get_external_service_a_client() -> ExternalServiceAClient:
     return container.external_service_a_client()
 
 
+@lru_cache
 def get_external_service_b_client() -> ExternalServiceBClient:
     return container.external_service_b_client()
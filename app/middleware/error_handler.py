@@ -1,61 +1,91 @@
+import secrets
 import time
-import uuid
-from typing import Callable
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
 
-logger = structlog.get_logger()
+from app.observability import get_logger
 
+logger = get_logger(__name__)
 
-async def error_handler_middleware(request: Request, call_next: Callable) -> Response:
-    request_id = str(uuid.uuid4())
-    start_time = time.time()
 
-    # Add request ID to structured logging context
-    structlog.contextvars.clear_contextvars()
-    structlog.contextvars.bind_contextvars(request_id=request_id)
+class ErrorHandlerMiddleware:
+    """
+    Pure ASGI middleware that logs requests and turns unhandled errors into 500s.
 
-    logger.info(
-        "Request started",
-        method=request.method,
-        url=str(request.url),
-        path=request.url.path,
-    )
+    Unlike ``@app.middleware("http")`` this doesn't go through
+    BaseHTTPMiddleware, so there is no extra task or response buffering per
+    request; the X-Request-ID header is injected into the response start
+    message as it is sent.
+    """
 
-    try:
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        processing_time = time.time() - start_time
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = secrets.token_hex(16)
+        start_time = time.perf_counter()
+        response_started = False
+
+        # Add request ID to structured logging context. Each request runs in its
+        # own task, so only our own key has to be unbound afterwards.
+        structlog.contextvars.bind_contextvars(request_id=request_id)
 
         logger.info(
-            "Request completed",
-            status_code=response.status_code,
-            processing_time=processing_time,
+            "Request started",
+            method=scope["method"],
+            url=str(URL(scope=scope)),
+            path=scope["path"],
         )
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
 
-    except Exception as e:
-        processing_time = time.time() - start_time
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
 
-        logger.error(
-            "Request failed",
-            error=str(e),
-            error_type=type(e).__name__,
-            processing_time=processing_time,
-        )
+                logger.info(
+                    "Request completed",
+                    status_code=message["status"],
+                    processing_time=time.perf_counter() - start_time,
+                )
+            await send(message)
 
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Internal server error",
-                "request_id": request_id,
-                "message": str(e)
-                if request.app.state.settings.debug
-                else "Something went wrong",
-            },
-            headers={"X-Request-ID": request_id},
-        )
+        try:
+            await self.app(scope, receive, send_with_request_id)
+
+        except Exception as e:
+            processing_time = time.perf_counter() - start_time
+
+            logger.error(
+                "Request failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                processing_time=processing_time,
+            )
+
+            # Too late to replace a response that is already being sent
+            if response_started:
+                raise
+
+            response = ORJSONResponse(
+                status_code=500,
+                content={
+                    "error": "Internal server error",
+                    "request_id": request_id,
+                    "message": str(e)
+                    if scope["app"].state.settings.debug
+                    else "Something went wrong",
+                },
+                headers={"X-Request-ID": request_id},
+            )
+            await response(scope, receive, send)
+        finally:
+            structlog.contextvars.unbind_contextvars("request_id")
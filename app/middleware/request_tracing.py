@@ -1,8 +1,8 @@
 """
 Request tracing middleware for OpenTelemetry and structured logging.
 """
+import secrets
 import time
-import uuid
 from typing import Callable
 from fastapi import Request, Response
 from opentelemetry import trace
@@ -23,11 +23,11 @@ async def request_tracing_middleware(request: Request, call_next: Callable) -> R
     4. Measures request duration
     """
     # Generate unique request ID
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
     set_request_id(request_id)
 
     # Start timing
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Get trace information if available
     tracer = trace.get_tracer(__name__)
@@ -57,7 +57,7 @@ async def request_tracing_middleware(request: Request, call_next: Callable) -> R
             response = await call_next(request)
 
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Set additional span attributes
             span.set_attribute("http.status_code", response.status_code)
@@ -82,7 +82,7 @@ async def request_tracing_middleware(request: Request, call_next: Callable) -> R
 
         except Exception as e:
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Set error span attributes
             span.set_attribute("http.status_code", 500)
@@ -1,30 +1,33 @@
 """
 OpenTelemetry and logging configuration for ELK stack integration.
 """
+import collections
+import contextlib
 import logging
+import secrets
 import sys
-from typing import Optional
-import uuid
+import threading
+import weakref
+from typing import TYPE_CHECKING, Optional
 from contextvars import ContextVar
 
+import orjson
 import structlog
 from opentelemetry import trace, metrics
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from elasticsearch import Elasticsearch
-from elasticsearch.exceptions import ConnectionError as ESConnectionError
 
 from app.config import settings
 
+# The OpenTelemetry SDK, exporters, instrumentors and the Elasticsearch client
+# are heavy to import, so they are only loaded when the feature is enabled.
+if TYPE_CHECKING:
+    from elasticsearch import Elasticsearch
+
+# Numeric log level, unknown names fall back to INFO
+LOG_LEVEL = logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
+
+# Attributes every LogRecord carries; anything else was passed via `extra`
+_STD_LOGRECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message"}
+
 # Context variables for request tracing
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
@@ -32,34 +35,88 @@ span_id_var: ContextVar[Optional[str]] = ContextVar("span_id", default=None)
 
 
 class ElasticsearchHandler(logging.Handler):
-    """Custom logging handler that sends logs to Elasticsearch."""
+    """Custom logging handler that sends logs to Elasticsearch.
+
+    Records are buffered in memory and shipped in bulk by a background thread,
+    so logging never blocks on an HTTP round-trip to Elasticsearch.
+    """
+
+    flush_interval = 0.5  # seconds
+    batch_size = 500
+    max_buffer_size = 10_000
 
     def __init__(self, elasticsearch_url: str, index_name: str):
         super().__init__()
         self.elasticsearch_url = elasticsearch_url
         self.index_name = index_name
-        self.es_client: Optional[Elasticsearch] = None
+        self.es_client: Optional["Elasticsearch"] = None
+        self._queue: collections.deque = collections.deque(maxlen=self.max_buffer_size)
+        self._wakeup = threading.Event()
+        # Not `_closed`: logging.Handler uses that name for its own flag
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._shipping = threading.local()
         self._initialize_client()
 
+        if self.es_client:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="elasticsearch-log-flusher", daemon=True
+            )
+            self._flush_thread.start()
+
     def _initialize_client(self):
-        """Initialize Elasticsearch client with error handling."""
+        """Initialize Elasticsearch client with error handling.
+
+        Creating the client doesn't connect; reachability is checked from the
+        flusher thread so an unavailable cluster can't stall app startup.
+        """
+        from elasticsearch import Elasticsearch
+
         try:
             self.es_client = Elasticsearch([self.elasticsearch_url])
-            # Test connection
-            if self.es_client:
-                self.es_client.info()
+        except Exception as e:
+            print(f"Warning: Elasticsearch initialization failed: {e}")
+            self.es_client = None
+
+    def _check_connection(self):
+        """Warn once if Elasticsearch can't be reached; flush() keeps retrying."""
+        from elasticsearch.exceptions import ConnectionError as ESConnectionError
+
+        if not self.es_client:
+            return
+
+        try:
+            with self._shipping_logs():
+                self.es_client.options(request_timeout=5).info()
         except ESConnectionError:
             print(
-                f"Warning: Could not connect to Elasticsearch at {self.elasticsearch_url}"
+                "Warning: Could not connect to Elasticsearch at "
+                f"{self.elasticsearch_url}"
             )
-            self.es_client = None
         except Exception as e:
-            print(f"Warning: Elasticsearch initialization failed: {e}")
-            self.es_client = None
+            print(f"Warning: Elasticsearch connection check failed: {e}")
+
+    @contextlib.contextmanager
+    def _shipping_logs(self):
+        """Mark the current thread as talking to Elasticsearch.
+
+        The client and its HTTP stack (elastic_transport, urllib3, ...) log
+        their own requests; shipping those would queue a new bulk request for
+        every flush, so records emitted meanwhile from this thread are dropped.
+        """
+        self._shipping.active = True
+        try:
+            yield
+        finally:
+            self._shipping.active = False
 
     def emit(self, record):
         """Send log record to Elasticsearch."""
-        if not self.es_client:
+        # Once closed nothing ships the buffer anymore, so drop the record
+        if not self.es_client or self._stop_event.is_set():
+            return
+
+        if getattr(self._shipping, "active", False):
             return
 
         try:
@@ -90,35 +147,93 @@ class ElasticsearchHandler(logging.Handler):
                 log_entry["exception"] = self.format(record)
 
             # Add extra fields from the record
-            for key, value in record.__dict__.items():
-                if key not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "message",
-                ]:
-                    log_entry[key] = value
-
-            self.es_client.index(index=self.index_name, body=log_entry)
+            log_entry.update(
+                {
+                    key: value
+                    for key, value in record.__dict__.items()
+                    if key not in _STD_LOGRECORD_ATTRS
+                }
+            )
+
+            # Serialize up front; bulk() sends raw JSON documents as-is
+            self._queue.append(orjson.dumps(log_entry, default=str))
+            if len(self._queue) >= self.batch_size:
+                self._wakeup.set()
         except Exception as e:
-            print(f"Failed to send log to Elasticsearch: {e}")
+            print(f"Failed to queue log for Elasticsearch: {e}")
+
+    def _flush_loop(self):
+        """Periodically ship buffered records until the handler is closed."""
+        self._check_connection()
+        while not self._stop_event.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Send all buffered records to Elasticsearch in bulk."""
+        # close() already made the last attempt; logging.shutdown still
+        # flushes closed handlers, which would retry against a dead cluster
+        if self._stop_event.is_set():
+            return
+        self._send_buffer()
+
+    def _send_buffer(self):
+        """Ship the buffer once.
+
+        If Elasticsearch can't be reached the batch goes back on the queue for
+        the next flush; the queue is bounded, so the oldest records are dropped
+        first during a long outage.
+        """
+        es_client = self.es_client
+        if not es_client or not self._queue:
+            return
+
+        from elasticsearch import helpers
+        from elasticsearch.exceptions import ConnectionError as ESConnectionError
+
+        actions = []
+        while self._queue:
+            try:
+                actions.append(self._queue.popleft())
+            except IndexError:
+                break
+
+        try:
+            with self._shipping_logs():
+                helpers.bulk(
+                    es_client.options(request_timeout=5),
+                    actions,
+                    index=self.index_name,
+                    chunk_size=self.batch_size,
+                )
+        except ESConnectionError as e:
+            self._requeue(actions)
+            print(f"Failed to send logs to Elasticsearch, will retry: {e}")
+        except Exception as e:
+            print(f"Failed to send logs to Elasticsearch: {e}")
+
+    def _requeue(self, actions):
+        """Put unsent records back in front of newer ones, within max_buffer_size."""
+        room = self.max_buffer_size - len(self._queue)
+        if room > 0:
+            self._queue.extendleft(reversed(actions[-room:]))
+
+    def close(self):
+        """Stop the background flusher and ship any remaining records.
+
+        Safe to call more than once; dictConfig and logging.shutdown both
+        close handlers.
+        """
+        if not self._stop_event.is_set():
+            self._stop_event.set()
+            self._wakeup.set()
+            if self._flush_thread:
+                self._flush_thread.join(timeout=5)
+            self._send_buffer()
+            # Whatever still couldn't be sent goes away with the handler
+            self._queue.clear()
+        super().close()
 
 
 def add_trace_context(logger, method_name, event_dict):
@@ -138,11 +253,33 @@ def add_trace_context(logger, method_name, event_dict):
     return event_dict
 
 
+def _parse_key_value_pairs(value: str) -> dict[str, str]:
+    """Parse a 'key1=value1,key2=value2' string, skipping malformed entries."""
+    pairs = {}
+    for item in value.split(","):
+        key, sep, val = item.partition("=")
+        if sep:
+            pairs[key.strip()] = val.strip()
+    return pairs
+
+
 def setup_opentelemetry():
     """Initialize OpenTelemetry tracing and metrics."""
-    if not settings.enable_tracing:
+    if not (settings.enable_tracing or settings.enable_metrics):
         return
 
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+        OTLPMetricExporter,
+    )
+
     # Create resource with service information
     resource_attributes = {
         "service.name": settings.otel_service_name,
@@ -151,30 +288,23 @@ def setup_opentelemetry():
     }
 
     # Add additional resource attributes from config
-    if settings.otel_resource_attributes:
-        for attr in settings.otel_resource_attributes.split(","):
-            if "=" in attr:
-                key, value = attr.split("=", 1)
-                resource_attributes[key.strip()] = value.strip()
+    resource_attributes.update(
+        _parse_key_value_pairs(settings.otel_resource_attributes)
+    )
 
     resource = Resource.create(resource_attributes)
 
+    # OTLP exporter settings shared by traces and metrics
+    headers = _parse_key_value_pairs(settings.otel_exporter_otlp_headers)
+
+    traces_endpoint = f"{settings.otel_exporter_otlp_endpoint}/v1/traces"
+    metrics_endpoint = f"{settings.otel_exporter_otlp_endpoint}/v1/metrics"
+
     # Setup tracing
     if settings.enable_tracing:
         trace.set_tracer_provider(TracerProvider(resource=resource))
 
-        # Setup OTLP exporter
-        headers = {}
-        if settings.otel_exporter_otlp_headers:
-            for header in settings.otel_exporter_otlp_headers.split(","):
-                if "=" in header:
-                    key, value = header.split("=", 1)
-                    headers[key.strip()] = value.strip()
-
-        otlp_exporter = OTLPSpanExporter(
-            endpoint=f"{settings.otel_exporter_otlp_endpoint}/v1/traces",
-            headers=headers,
-        )
+        otlp_exporter = OTLPSpanExporter(endpoint=traces_endpoint, headers=headers)
 
         span_processor = BatchSpanProcessor(otlp_exporter)
         tracer_provider = trace.get_tracer_provider()
@@ -184,10 +314,7 @@ def setup_opentelemetry():
     # Setup metrics
     if settings.enable_metrics:
         metric_reader = PeriodicExportingMetricReader(
-            OTLPMetricExporter(
-                endpoint=f"{settings.otel_exporter_otlp_endpoint}/v1/metrics",
-                headers=headers if "headers" in locals() else {},
-            ),
+            OTLPMetricExporter(endpoint=metrics_endpoint, headers=headers),
             export_interval_millis=10000,
         )
         metrics.set_meter_provider(
@@ -199,6 +326,11 @@ def setup_instrumentation():
     """Setup OpenTelemetry auto-instrumentation."""
     if settings.enable_tracing:
         try:
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+            from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+            from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
             # Instrument FastAPI
             FastAPIInstrumentor().instrument()  # type: ignore
 
@@ -225,18 +357,21 @@ def setup_logging():
         structlog.dev.set_exc_info,
     ]
 
-    # Add JSON formatting for production, pretty formatting for development
+    # Add JSON formatting for production, pretty formatting for development.
+    # orjson renders bytes, so production logs go through a bytes logger.
     if settings.debug:
         processors.append(structlog.dev.ConsoleRenderer())  # type: ignore
+        logger_factory = structlog.WriteLoggerFactory()
     else:
-        processors.append(structlog.processors.JSONRenderer())  # type: ignore
+        processors.append(
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)  # type: ignore
+        )
+        logger_factory = structlog.BytesLoggerFactory()
 
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.WriteLoggerFactory(),
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, settings.log_level.upper())
-        ),
+        logger_factory=logger_factory,
+        wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
         cache_logger_on_first_use=True,
     )
 
@@ -244,7 +379,7 @@ def setup_logging():
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper()),
+        level=LOG_LEVEL,
     )
 
     # Add Elasticsearch handler if configured and not in debug mode
@@ -257,21 +392,33 @@ def setup_logging():
             es_handler = ElasticsearchHandler(
                 settings.elasticsearch_url, settings.elasticsearch_index
             )
-            es_handler.setLevel(getattr(logging, settings.log_level.upper()))
+            es_handler.setLevel(LOG_LEVEL)
             logging.getLogger().addHandler(es_handler)
         except Exception as e:
             print(f"Warning: Could not add Elasticsearch handler: {e}")
 
 
+# Loggers handed out by get_logger, so they can be warmed up after setup
+_loggers: "weakref.WeakSet" = weakref.WeakSet()
+
+
 def get_logger(name: Optional[str] = None):
     """Get a structured logger instance."""
-    return structlog.get_logger(name or __name__)
+    logger = structlog.get_logger(name or __name__)
+    _loggers.add(logger)
+    return logger
+
+
+def warm_up_loggers():
+    """Assemble get_logger's cached loggers so the first request doesn't have to."""
+    for logger in list(_loggers):
+        logger.bind()
 
 
 def set_request_id(request_id: Optional[str] = None):
     """Set request ID in context for request tracing."""
     if request_id is None:
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
 
     request_id_var.set(request_id)
     return request_id
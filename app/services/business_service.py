@@ -1,11 +1,13 @@
 import asyncio
+import json
 import time
-import structlog
-from typing import Tuple, cast
+import orjson
+from typing import Awaitable, Tuple
 
 from app.clients.external_client import ExternalServiceAClient, ExternalServiceBClient
+from app.observability import get_logger
 
-logger = structlog.get_logger()
+logger = get_logger(__name__)
 
 
 class BusinessService:
@@ -18,7 +20,7 @@ class BusinessService:
         self.service_b_client = service_b_client
 
     async def process_data(self, input_data: str, options: dict[str, str]) -> dict:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info("Starting data processing", input_data=input_data, options=options)
 
@@ -30,7 +32,7 @@ class BusinessService:
             input_data, service_a_data, service_b_data
         )
 
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
 
         logger.info("Data processing completed", processing_time_ms=processing_time)
 
@@ -43,38 +45,24 @@ class BusinessService:
 
     async def _fetch_external_data(self, input_data: str) -> Tuple[dict, dict]:
         """Fetch data from both external services concurrently."""
-        tasks = [
-            self.service_a_client.get_data(input_data),
-            self.service_b_client.fetch_metadata(input_data),
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions
-        service_a_result = results[0]
-        service_a_data: dict = (
-            cast(dict, service_a_result)
-            if not isinstance(service_a_result, Exception)
-            else {}
+        service_a_data, service_b_data = await asyncio.gather(
+            self._fetch_or_empty(
+                self.service_a_client.get_data(input_data), "Service A"
+            ),
+            self._fetch_or_empty(
+                self.service_b_client.fetch_metadata(input_data), "Service B"
+            ),
         )
-
-        service_b_data: dict = {}
-        if len(results) > 1:
-            service_b_result = results[1]
-            service_b_data = (
-                cast(dict, service_b_result)
-                if not isinstance(service_b_result, Exception)
-                else {}
-            )
-
-        if isinstance(service_a_result, Exception):
-            logger.warning("Service A call failed", error=str(service_a_result))
-
-        if len(results) > 1 and isinstance(results[1], Exception):
-            logger.warning("Service B call failed", error=str(results[1]))
-
         return service_a_data, service_b_data
 
+    async def _fetch_or_empty(self, call: Awaitable[dict], service_name: str) -> dict:
+        """Await a service call, degrading to empty data if it fails."""
+        try:
+            return await call
+        except Exception as e:
+            logger.warning(f"{service_name} call failed", error=str(e))
+            return {}
+
     def _combine_data(
         self, input_data: str, service_a_data: dict, service_b_data: dict
     ) -> str:
@@ -86,5 +74,13 @@ class BusinessService:
             "processed_at": time.time(),
         }
 
-        # Example business logic - you'd replace this with actual processing
-        return f"Processed: {len(str(combined))} characters of data"
+        # Example business logic - you'd replace this with actual processing.
+        # The external payloads are JSON already, so measure their encoded size
+        # rather than building a recursive repr() of the whole dict.
+        try:
+            size = len(orjson.dumps(combined))
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits, stdlib json doesn't
+            encoded = json.dumps(combined, ensure_ascii=False, separators=(",", ":"))
+            size = len(encoded.encode())
+        return f"Processed: {size} bytes of data"
@@ -8,49 +8,60 @@ os.environ["ELASTICSEARCH_URL"] = ""
 os.environ["DEBUG"] = "true"
 
 # ruff: noqa: E402
+from typing import Protocol
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock
-from fastapi.testclient import TestClient
-import httpx
 
-from app.main import app
-from app.clients.external_client import ExternalServiceAClient, ExternalServiceBClient
 from app.services.business_service import BusinessService
 
 
-@pytest.fixture
-def test_client():
-    """Create a test client for FastAPI app."""
-    return TestClient(app)
+# Minimal specs for the mocked clients; speccing against a Protocol keeps mock
+# construction cheap compared to walking the real client classes.
+class ServiceAClientSpec(Protocol):
+    async def get_data(self, query: str) -> dict: ...
+
+    async def process_item(self, item_data: dict) -> dict: ...
+
+
+class ServiceBClientSpec(Protocol):
+    async def fetch_metadata(self, item_id: str) -> dict: ...
+
+    async def update_status(self, item_id: str, status: str) -> dict: ...
+
 
+# Default return values of the mocked client methods
+SERVICE_A_DEFAULTS = {
+    "get_data": {"data": "service_a_data"},
+    "process_item": {"result": "processed"},
+}
+SERVICE_B_DEFAULTS = {
+    "fetch_metadata": {"metadata": "service_b_metadata"},
+    "update_status": {"status": "updated"},
+}
 
-@pytest_asyncio.fixture
-async def mock_http_client():
-    """Create a mock HTTP client."""
-    client = AsyncMock(spec=httpx.AsyncClient)
+
+def _build_mock_client(spec, defaults: dict):
+    client = AsyncMock(spec=spec)
+    for method, return_value in defaults.items():
+        setattr(client, method, AsyncMock(return_value=return_value))
     return client
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def mock_external_service_a_client():
-    """Create a mock for External Service A client."""
-    client = AsyncMock(spec=ExternalServiceAClient)
-    client.get_data = AsyncMock(return_value={"data": "service_a_data"})
-    client.process_item = AsyncMock(return_value={"result": "processed"})
-    return client
+    """Create a mock for External Service A client, shared by the session."""
+    return _build_mock_client(ServiceAClientSpec, SERVICE_A_DEFAULTS)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def mock_external_service_b_client():
-    """Create a mock for External Service B client."""
-    client = AsyncMock(spec=ExternalServiceBClient)
-    client.fetch_metadata = AsyncMock(return_value={"metadata": "service_b_metadata"})
-    client.update_status = AsyncMock(return_value={"status": "updated"})
-    return client
+    """Create a mock for External Service B client, shared by the session."""
+    return _build_mock_client(ServiceBClientSpec, SERVICE_B_DEFAULTS)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def business_service_with_mocks(
     mock_external_service_a_client, mock_external_service_b_client
 ):
@@ -61,15 +72,17 @@ async def business_service_with_mocks(
     )
 
 
-@pytest.fixture
-def override_dependencies():
-    """Fixture to override FastAPI dependencies for testing."""
-
-    def _override(overrides: dict):
-        for dependency, mock in overrides.items():
-            app.dependency_overrides[dependency] = lambda m=mock: m
-
-    yield _override
-
-    # Clean up overrides after test
-    app.dependency_overrides.clear()
+@pytest.fixture(autouse=True)
+def reset_mock_clients(request):
+    """Undo per-test changes to the shared mock clients before each test."""
+    for fixture_name, defaults in (
+        ("mock_external_service_a_client", SERVICE_A_DEFAULTS),
+        ("mock_external_service_b_client", SERVICE_B_DEFAULTS),
+    ):
+        if fixture_name not in request.fixturenames:
+            continue
+
+        client = request.getfixturevalue(fixture_name)
+        client.reset_mock(return_value=False, side_effect=True)
+        for method, return_value in defaults.items():
+            getattr(client, method).return_value = return_value
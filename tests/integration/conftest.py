@@ -0,0 +1,56 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+
+
+class CachingClient(httpx.AsyncClient):
+    """Async test client that memoizes GETs to read-only endpoints."""
+
+    cacheable_prefixes = ("/health",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: dict[str, httpx.Response] = {}
+
+    async def get(self, url, **kwargs) -> httpx.Response:
+        path = str(url)
+        if kwargs or not path.startswith(self.cacheable_prefixes):
+            return await super().get(url, **kwargs)
+
+        if path not in self._cache:
+            self._cache[path] = await super().get(path)
+        return self._cache[path]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Create an async HTTP client bound to the FastAPI app, shared by the session."""
+    async with CachingClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides():
+    """Keep dependency overrides from leaking between tests sharing the app."""
+    overrides = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+
+
+@pytest.fixture
+def override_dependencies():
+    """Fixture to override FastAPI dependencies for testing."""
+
+    def _override(overrides: dict):
+        for dependency, mock in overrides.items():
+            app.dependency_overrides[dependency] = lambda m=mock: m
+
+    yield _override
+
+    # Clean up overrides after test
+    app.dependency_overrides.clear()
@@ -1,28 +1,39 @@
-from fastapi.testclient import TestClient
+import httpx
+import orjson
 
+from app.dependencies import get_business_service
 
-def test_health_check(test_client: TestClient):
+# Request bodies are serialized once and sent as raw content
+_JSON_HEADERS = {"content-type": "application/json"}
+_PROCESS_PAYLOAD = orjson.dumps(
+    {"input_data": "test_input", "options": {"key": "value"}}
+)
+_PROCESS_PAYLOAD_NO_OPTIONS = orjson.dumps({"input_data": "test_input", "options": {}})
+_INVALID_PAYLOAD = orjson.dumps({"invalid_field": "test_input"})
+
+
+async def test_health_check(async_client: httpx.AsyncClient):
     """Test health check endpoint."""
-    response = test_client.get("/health")
+    response = await async_client.get("/health")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
 
     assert data["status"] == "healthy"
     assert "version" in data
     assert "timestamp" in data
 
 
-def test_process_data_success(test_client: TestClient):
+async def test_process_data_success(async_client: httpx.AsyncClient):
     """Test process data endpoint works."""
     # Act
-    response = test_client.post(
-        "/process", json={"input_data": "test_input", "options": {"key": "value"}}
+    response = await async_client.post(
+        "/process", content=_PROCESS_PAYLOAD, headers=_JSON_HEADERS
     )
 
     # Assert
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Check that all required fields are present
     assert "processed_data" in data
@@ -32,32 +43,34 @@ def test_process_data_success(test_client: TestClient):
     assert isinstance(data["processing_time_ms"], float)
 
 
-def test_process_data_validation_error(test_client: TestClient):
+async def test_process_data_validation_error(async_client: httpx.AsyncClient):
     """Test process data endpoint with invalid input."""
-    response = test_client.post("/process", json={"invalid_field": "test_input"})
+    response = await async_client.post(
+        "/process", content=_INVALID_PAYLOAD, headers=_JSON_HEADERS
+    )
 
     assert response.status_code == 422  # Validation error
 
 
-def test_process_data_business_service_error(test_client: TestClient, monkeypatch):
-    """Test process data endpoint when business service fails."""
-
-    # Arrange - mock the business service to fail
-    def mock_failing_process_data(*args, **kwargs):
+class _FailingBusinessService:
+    async def process_data(self, *args, **kwargs):
         raise Exception("Business logic failed")
 
-    from app.services import business_service
 
-    monkeypatch.setattr(
-        business_service.BusinessService, "process_data", mock_failing_process_data
-    )
+async def test_process_data_business_service_error(
+    async_client: httpx.AsyncClient, override_dependencies
+):
+    """Test process data endpoint when business service fails."""
+
+    # Arrange - inject a business service that fails
+    override_dependencies({get_business_service: _FailingBusinessService()})
 
     # Act
-    response = test_client.post(
-        "/process", json={"input_data": "test_input", "options": {}}
+    response = await async_client.post(
+        "/process", content=_PROCESS_PAYLOAD_NO_OPTIONS, headers=_JSON_HEADERS
     )
 
     # Assert
     assert response.status_code == 500
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["detail"] == "Processing failed"
@@ -0,0 +1,91 @@
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.dependencies import get_business_service
+from app.main import app
+from app.middleware.error_handler import ErrorHandlerMiddleware
+
+_PROCESS_PAYLOAD = orjson.dumps({"input_data": "test_input", "options": {}})
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _failing_business_service():
+    raise RuntimeError("Dependency wiring failed")
+
+
+@pytest.fixture
+def failing_dependency():
+    """Make /process fail outside the route's own error handling."""
+    app.dependency_overrides[get_business_service] = _failing_business_service
+
+
+async def test_unhandled_error_returns_500(
+    async_client: httpx.AsyncClient, failing_dependency
+):
+    """Test unhandled exceptions become a JSON 500 with the request ID."""
+    # Act
+    response = await async_client.post(
+        "/process", content=_PROCESS_PAYLOAD, headers=_JSON_HEADERS
+    )
+
+    # Assert
+    assert response.status_code == 500
+    data = orjson.loads(response.content)
+    assert data["error"] == "Internal server error"
+    assert len(data["request_id"]) == 32
+    assert "X-Request-ID" in response.headers
+    # Tests run with DEBUG=true, so the error message is exposed
+    assert data["message"] == "Dependency wiring failed"
+
+
+async def test_unhandled_error_hides_message_outside_debug(
+    async_client: httpx.AsyncClient, failing_dependency, monkeypatch
+):
+    """Test the error message isn't leaked when debug is off."""
+    # Arrange
+    monkeypatch.setattr(app.state.settings, "debug", False)
+
+    # Act
+    response = await async_client.post(
+        "/process", content=_PROCESS_PAYLOAD, headers=_JSON_HEADERS
+    )
+
+    # Assert
+    assert response.status_code == 500
+    assert orjson.loads(response.content)["message"] == "Something went wrong"
+
+
+async def test_successful_response_gets_request_id(async_client: httpx.AsyncClient):
+    """Test the request ID header is added to normal responses."""
+    # Act
+    response = await async_client.post(
+        "/process", content=_PROCESS_PAYLOAD, headers=_JSON_HEADERS
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert len(response.headers["X-Request-ID"]) == 32
+
+
+async def test_error_after_response_started_is_reraised():
+    """Test errors mid-stream propagate, since the 500 can't be sent anymore."""
+    # Arrange
+    streaming_app = FastAPI()
+    streaming_app.add_middleware(ErrorHandlerMiddleware)  # type: ignore
+
+    @streaming_app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"partial"
+            raise RuntimeError("Stream broke")
+
+        return StreamingResponse(body())
+
+    transport = httpx.ASGITransport(app=streaming_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="Stream broke"):
+            await client.get("/stream")
@@ -1,28 +1,15 @@
-import pytest
-
-from app.services.business_service import BusinessService
-
-
-@pytest.mark.asyncio
 async def test_process_data_success(
+    business_service_with_mocks,
     mock_external_service_a_client,
     mock_external_service_b_client,
 ):
     """Test successful data processing with mocked external services."""
     # Arrange
-    business_service = BusinessService(
-        service_a_client=mock_external_service_a_client,
-        service_b_client=mock_external_service_b_client,
-    )
-
     input_data = "test_input"
     options = {"option1": "value1"}
 
-    mock_external_service_a_client.get_data.return_value = {"result": "data_from_a"}
-    mock_external_service_b_client.fetch_metadata.return_value = {"meta": "data_from_b"}
-
     # Act
-    result = await business_service.process_data(input_data, options)
+    result = await business_service_with_mocks.process_data(input_data, options)
 
     # Assert
     assert "processed_data" in result
@@ -31,23 +18,22 @@ async def test_process_data_success(
     assert "processing_time_ms" in result
     assert isinstance(result["processing_time_ms"], float)
 
+    # Default payloads from the shared mock clients
+    assert "service_a_data" in result["source_a_data"]
+    assert "service_b_metadata" in result["source_b_data"]
+
     # Verify external service calls
     mock_external_service_a_client.get_data.assert_called_once_with(input_data)
     mock_external_service_b_client.fetch_metadata.assert_called_once_with(input_data)
 
 
-@pytest.mark.asyncio
 async def test_process_data_with_service_a_failure(
+    business_service_with_mocks,
     mock_external_service_a_client,
     mock_external_service_b_client,
 ):
     """Test data processing when Service A fails."""
     # Arrange
-    business_service = BusinessService(
-        service_a_client=mock_external_service_a_client,
-        service_b_client=mock_external_service_b_client,
-    )
-
     input_data = "test_input"
     options = {}
 
@@ -55,10 +41,9 @@ async def test_process_data_with_service_a_failure(
     mock_external_service_a_client.get_data.side_effect = Exception(
         "Service A unavailable"
     )
-    mock_external_service_b_client.fetch_metadata.return_value = {"meta": "data_from_b"}
 
     # Act
-    result = await business_service.process_data(input_data, options)
+    result = await business_service_with_mocks.process_data(input_data, options)
 
     # Assert
     assert "processed_data" in result
@@ -68,21 +53,16 @@ async def test_process_data_with_service_a_failure(
     # Service A should return empty dict due to exception
     assert result["source_a_data"] == "{}"
     # Service B should work normally
-    assert "data_from_b" in result["source_b_data"]
+    assert "service_b_metadata" in result["source_b_data"]
 
 
-@pytest.mark.asyncio
 async def test_process_data_with_both_services_failing(
+    business_service_with_mocks,
     mock_external_service_a_client,
     mock_external_service_b_client,
 ):
     """Test data processing when both external services fail."""
     # Arrange
-    business_service = BusinessService(
-        service_a_client=mock_external_service_a_client,
-        service_b_client=mock_external_service_b_client,
-    )
-
     input_data = "test_input"
     options = {}
 
@@ -95,7 +75,7 @@ async def test_process_data_with_both_services_failing(
     )
 
     # Act
-    result = await business_service.process_data(input_data, options)
+    result = await business_service_with_mocks.process_data(input_data, options)
 
     # Assert
     assert "processed_data" in result
@@ -104,3 +84,19 @@ async def test_process_data_with_both_services_failing(
 
     # Business logic should still work with empty data
     assert "Processed:" in result["processed_data"]
+
+
+async def test_process_data_with_integers_wider_than_64_bits(
+    business_service_with_mocks,
+    mock_external_service_a_client,
+):
+    """Test payloads orjson can't encode still get a size."""
+    # Arrange
+    mock_external_service_a_client.get_data.return_value = {"id": 2**64}
+
+    # Act
+    result = await business_service_with_mocks.process_data("test_input", {})
+
+    # Assert
+    assert result["processed_data"].startswith("Processed:")
+    assert str(2**64) in result["source_a_data"]
@@ -1,95 +1,97 @@
+import json
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 import httpx
 
 from app.clients.external_client import ExternalServiceAClient, ExternalServiceBClient
 
-
-@pytest.mark.asyncio
-async def test_external_service_a_get_data():
-    """Test ExternalServiceAClient.get_data method."""
-    # Arrange
-    mock_http_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"result": "test_data"}
-    mock_response.raise_for_status.return_value = None
-    mock_http_client.request.return_value = mock_response
-
-    client = ExternalServiceAClient(
-        http_client=mock_http_client, base_url="https://service-a.example.com"
-    )
-
-    # Act
-    result = await client.get_data("test_query")
-
-    # Assert
-    assert result == {"result": "test_data"}
-    mock_http_client.request.assert_called_once_with(
-        "GET", "https://service-a.example.com/api/data", params={"query": "test_query"}
-    )
-
-
-@pytest.mark.asyncio
-async def test_external_service_a_process_item():
-    """Test ExternalServiceAClient.process_item method."""
+SERVICE_A_URL = "https://service-a.example.com"
+SERVICE_B_URL = "https://service-b.example.com"
+
+
+@pytest.mark.parametrize(
+    "client_cls, base_url, method, args, payload, http_method, url, body",
+    [
+        pytest.param(
+            ExternalServiceAClient,
+            SERVICE_A_URL,
+            "get_data",
+            ("test_query",),
+            {"result": "test_data"},
+            "GET",
+            f"{SERVICE_A_URL}/api/data?query=test_query",
+            None,
+            id="service_a_get_data",
+        ),
+        pytest.param(
+            ExternalServiceAClient,
+            SERVICE_A_URL,
+            "process_item",
+            ({"item": "test_item"},),
+            {"processed": True},
+            "POST",
+            f"{SERVICE_A_URL}/api/process",
+            {"item": "test_item"},
+            id="service_a_process_item",
+        ),
+        pytest.param(
+            ExternalServiceBClient,
+            SERVICE_B_URL,
+            "fetch_metadata",
+            ("item123",),
+            {"metadata": "test_metadata"},
+            "GET",
+            f"{SERVICE_B_URL}/api/items/item123/metadata",
+            None,
+            id="service_b_fetch_metadata",
+        ),
+        pytest.param(
+            ExternalServiceBClient,
+            SERVICE_B_URL,
+            "update_status",
+            ("a/b c", "done"),
+            {"status": "updated"},
+            "PATCH",
+            f"{SERVICE_B_URL}/api/items/a%2Fb%20c",
+            {"status": "done"},
+            id="service_b_update_status_escapes_item_id",
+        ),
+    ],
+)
+async def test_client_calls(
+    respx_mock, client_cls, base_url, method, args, payload, http_method, url, body
+):
+    """Test each client method issues the expected request and returns its JSON."""
     # Arrange
-    mock_http_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"processed": True}
-    mock_response.raise_for_status.return_value = None
-    mock_http_client.request.return_value = mock_response
-
-    client = ExternalServiceAClient(
-        http_client=mock_http_client, base_url="https://service-a.example.com"
+    route = respx_mock.request(http_method, url).mock(
+        return_value=httpx.Response(200, json=payload)
     )
 
-    item_data = {"item": "test_item"}
+    async with httpx.AsyncClient(base_url=base_url) as http_client:
+        client = client_cls(http_client=http_client)
 
-    # Act
-    result = await client.process_item(item_data)
+        # Act
+        result = await getattr(client, method)(*args)
 
     # Assert
-    assert result == {"processed": True}
-    mock_http_client.request.assert_called_once_with(
-        "POST", "https://service-a.example.com/api/process", json=item_data
-    )
-
-
-@pytest.mark.asyncio
-async def test_external_service_b_fetch_metadata():
-    """Test ExternalServiceBClient.fetch_metadata method."""
-    # Arrange
-    mock_http_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"metadata": "test_metadata"}
-    mock_response.raise_for_status.return_value = None
-    mock_http_client.request.return_value = mock_response
-
-    client = ExternalServiceBClient(
-        http_client=mock_http_client, base_url="https://service-b.example.com"
-    )
+    assert result == payload
+    assert route.call_count == 1
+    request = respx_mock.calls.last.request
+    assert str(request.url) == url
+    if body is not None:
+        assert json.loads(request.content) == body
 
-    # Act
-    result = await client.fetch_metadata("item123")
 
-    # Assert
-    assert result == {"metadata": "test_metadata"}
-    mock_http_client.request.assert_called_once_with(
-        "GET", "https://service-b.example.com/api/items/item123/metadata"
-    )
-
-
-@pytest.mark.asyncio
-async def test_client_http_error_handling():
+async def test_client_http_error_handling(respx_mock):
     """Test client error handling when HTTP request fails."""
     # Arrange
-    mock_http_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_http_client.request.side_effect = httpx.HTTPError("Connection failed")
-
-    client = ExternalServiceAClient(
-        http_client=mock_http_client, base_url="https://service-a.example.com"
+    respx_mock.get(f"{SERVICE_A_URL}/api/data").mock(
+        side_effect=httpx.ConnectError("Connection failed")
     )
 
-    # Act & Assert
-    with pytest.raises(httpx.HTTPError):
-        await client.get_data("test_query")
+    async with httpx.AsyncClient(base_url=SERVICE_A_URL) as http_client:
+        client = ExternalServiceAClient(http_client=http_client)
+
+        # Act & Assert
+        with pytest.raises(httpx.HTTPError):
+            await client.get_data("test_query")
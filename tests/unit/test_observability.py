@@ -0,0 +1,90 @@
+import logging
+
+import orjson
+import pytest
+from elasticsearch import helpers
+
+from app.observability import ElasticsearchHandler
+
+
+@pytest.fixture
+def es_handler(monkeypatch):
+    """Elasticsearch handler pointed at a port nothing listens on."""
+    # Keep the background flusher from draining the buffer mid-test
+    monkeypatch.setattr(ElasticsearchHandler, "flush_interval", 60)
+    handler = ElasticsearchHandler("http://127.0.0.1:9", "test-logs")
+    yield handler
+    handler.close()
+
+
+def test_es_handler_close_is_idempotent(es_handler):
+    """Test closing the handler twice, as dictConfig and logging.shutdown do."""
+    # Act
+    es_handler.close()
+    es_handler.close()
+
+    # Assert
+    assert es_handler._flush_thread is not None
+    assert not es_handler._flush_thread.is_alive()
+
+
+def test_es_handler_drops_records_after_close(es_handler):
+    """Test records emitted after close aren't buffered for a dead flusher."""
+    # Arrange
+    es_handler.close()
+
+    # Act
+    es_handler.emit(logging.makeLogRecord({"msg": "late record"}))
+
+    # Assert
+    assert len(es_handler._queue) == 0
+
+
+def test_es_handler_drops_records_logged_while_shipping(es_handler, monkeypatch):
+    """Test records the client logs during a bulk send don't feed back into the buffer."""
+    # Arrange
+    sent = []
+
+    def fake_bulk(client, actions, **kwargs):
+        # The transport (or urllib3 at DEBUG) logs the request it just sent
+        es_handler.emit(
+            logging.makeLogRecord(
+                {"name": "urllib3.connectionpool", "msg": "PUT /_bulk 200"}
+            )
+        )
+        sent.extend(actions)
+
+    monkeypatch.setattr(helpers, "bulk", fake_bulk)
+    es_handler.emit(logging.makeLogRecord({"name": "app.main", "msg": "hello"}))
+
+    # Act
+    es_handler.flush()
+
+    # Assert
+    assert len(sent) == 1
+    assert len(es_handler._queue) == 0
+
+
+def test_es_handler_buffers_app_records(es_handler):
+    """Test application records are serialized into the buffer."""
+    # Act
+    es_handler.emit(logging.makeLogRecord({"name": "app.main", "msg": "hello"}))
+
+    # Assert
+    assert len(es_handler._queue) == 1
+
+
+def test_es_handler_requeues_records_when_unreachable(es_handler):
+    """Test records stay buffered while Elasticsearch can't be reached."""
+    # Arrange
+    es_handler.emit(logging.makeLogRecord({"name": "app.main", "msg": "first"}))
+    es_handler.emit(logging.makeLogRecord({"name": "app.main", "msg": "second"}))
+
+    # Act - nothing listens on the handler's port
+    es_handler.flush()
+
+    # Assert
+    assert [orjson.loads(doc)["message"] for doc in es_handler._queue] == [
+        "first",
+        "second",
+    ]